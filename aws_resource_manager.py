@@ -328,12 +328,10 @@ def main():
                 # Update the website
                 api_endpoint = result['outputs']['ApiEndpoint']
                 static_website_stack = args.static_website_stack
-                if not update_website.update_index_html(api_endpoint, config):
-                    print("Warning: Failed to update index.html with API endpoint.")
-                
-                # Add the messaging solution to the Solution Demonstrations section
-                if not update_website.add_messaging_to_solution_demos(config):
-                    print("Warning: Failed to add messaging solution to Solution Demonstrations section.")
+                # Set the API endpoint and add the messaging solution to the Solution Demonstrations
+                # section in a single read and write of index.html
+                if not update_website.update_website_content(api_endpoint, config):
+                    print("Warning: Failed to update index.html with API endpoint and messaging solution.")
                 
                 # Upload the updated website content if S3 bucket is available
                 s3_bucket = config.get('s3', {}).get('bucket')
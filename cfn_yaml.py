@@ -0,0 +1,48 @@
+"""
+CloudFormation YAML loading
+
+Parses CloudFormation templates that use the short-form intrinsic function
+tags (!Ref, !GetAtt, !Sub, ...). Kept free of boto3 so callers that only need
+to read templates do not pay for importing the AWS SDK.
+"""
+
+import yaml
+
+
+# Custom YAML loader for CloudFormation templates
+class CloudFormationYamlLoader(yaml.SafeLoader):
+    """Custom YAML loader that can handle CloudFormation intrinsic functions."""
+    pass
+
+# Add constructors for CloudFormation intrinsic functions
+def cfn_tag_constructor(loader, tag_suffix, node):
+    """Constructor for CloudFormation intrinsic functions."""
+    if isinstance(node, yaml.ScalarNode):
+        return {tag_suffix: loader.construct_scalar(node)}
+    elif isinstance(node, yaml.SequenceNode):
+        return {tag_suffix: loader.construct_sequence(node)}
+    elif isinstance(node, yaml.MappingNode):
+        return {tag_suffix: loader.construct_mapping(node)}
+    else:
+        raise yaml.constructor.ConstructorError(None, None, f"Unexpected node type: {node.id}", node.start_mark)
+
+# Register a single handler for every '!'-prefixed CloudFormation intrinsic function
+# (Ref, GetAtt, Sub, Join, ImportValue, Base64, Cidr, FindInMap, GetAZs, Select, Split, Transform, ...)
+CloudFormationYamlLoader.add_multi_constructor('!', cfn_tag_constructor)
+
+def load_cloudformation_yaml(yaml_content):
+    """
+    Load a CloudFormation YAML template with support for intrinsic functions.
+    
+    Args:
+        yaml_content: YAML content as a string
+        
+    Returns:
+        dict: Parsed YAML content
+    """
+    try:
+        return yaml.load(yaml_content, Loader=CloudFormationYamlLoader)
+    except Exception as e:
+        print(f"Warning: Error parsing CloudFormation YAML: {e}")
+        # Fall back to safe_load which might work for simpler templates
+        return yaml.safe_load(yaml_content)
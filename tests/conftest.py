@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the static website and deployment tests
+"""
+
+import os
+import re
+import sys
+import warnings
+import yaml
+import pytest
+from functools import lru_cache
+from pathlib import Path
+from unittest.mock import Mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+STATIC_WEBSITE_DIR = REPO_ROOT / 'iac' / 'static_website'
+
+# Make the repository's top-level scripts importable from every test module
+sys.path.insert(0, str(REPO_ROOT))
+
+# Prefer the LibYAML-backed loader; the pure-Python SafeLoader is much slower
+try:
+    from yaml import CSafeLoader as _BaseLoader
+except ImportError:
+    from yaml import SafeLoader as _BaseLoader
+    warnings.warn("LibYAML is not available; parsing CloudFormation templates with the pure-Python SafeLoader")
+
+
+# We'll use a custom loader to handle CloudFormation's custom YAML tags
+class CloudFormationLoader(_BaseLoader):
+    pass
+
+
+def construct_cfn_tag(loader, node):
+    if isinstance(node, yaml.ScalarNode):
+        return node.value
+    elif isinstance(node, yaml.SequenceNode):
+        return [loader.construct_scalar(i) for i in node.value]
+    else:
+        return loader.construct_mapping(node)
+
+
+# Add constructors for CloudFormation's custom YAML tags
+for tag in ['!Ref', '!GetAtt', '!Sub', '!Join', '!If', '!Equals', '!Not', '!FindInMap']:
+    CloudFormationLoader.add_constructor(tag, construct_cfn_tag)
+
+# Stripped before splitting index.css into rules so comments never end up in selectors
+_CSS_COMMENT_RE = re.compile(rb'/\*.*?\*/', re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _read(path, mtime):
+    """Read a file once per (path, mtime) so unchanged files are not re-read."""
+    return Path(path).read_bytes()
+
+
+def _load_template(path):
+    """Parse a CloudFormation template; the session-scoped fixture calls this once per run."""
+    # LibYAML reads bytes directly, so skip the text decoding layer
+    return yaml.load(Path(path).read_bytes(), CloudFormationLoader)
+
+
+@pytest.fixture(scope="session")
+def html_content():
+    """Raw bytes of the static website's index.html."""
+    html_path = STATIC_WEBSITE_DIR / 'index.html'
+    return _read(str(html_path), os.path.getmtime(html_path))
+
+
+@pytest.fixture(scope="session")
+def css_content():
+    """Raw bytes of the static website's index.css."""
+    css_path = STATIC_WEBSITE_DIR / 'index.css'
+    return _read(str(css_path), os.path.getmtime(css_path))
+
+
+@pytest.fixture(scope="session")
+def css_rules(css_content):
+    """Map each top-level CSS selector in index.css to the text of its declaration block."""
+    rules = {}
+    for chunk in _CSS_COMMENT_RE.sub(b'', css_content).split(b'}'):
+        selector, _, body = chunk.partition(b'{')
+        rules[selector.strip()] = body
+    return rules
+
+
+@pytest.fixture(scope="session")
+def cfn_template():
+    """Parsed static website CloudFormation template."""
+    template_path = STATIC_WEBSITE_DIR / 'template.yaml'
+    try:
+        return _load_template(template_path)
+    except (OSError, yaml.YAMLError) as e:
+        # Skip the template tests once rather than erroring in every one of them
+        pytest.skip(f"template unavailable: {e}")
+
+
+# Sections and logical IDs the granular template tests rely on; checked once per session
+_REQUIRED_TEMPLATE_KEYS = {
+    'Parameters': (),
+    'Resources': ('StaticWebsiteBucket', 'S3BucketPolicy', 'CloudFrontOriginAccessControl', 'CloudFrontDistribution'),
+    'Outputs': ('CloudFrontDistributionId',),
+}
+
+
+@pytest.fixture(scope="session")
+def validated_template(cfn_template):
+    """The parsed template, after checking it has the sections and resources the tests expect."""
+    missing = [section for section in _REQUIRED_TEMPLATE_KEYS if section not in cfn_template]
+    missing += [f"{section}.{key}" for section, keys in _REQUIRED_TEMPLATE_KEYS.items()
+                if section in cfn_template for key in keys if key not in cfn_template[section]]
+    assert not missing, f"Template schema invalid, missing: {', '.join(missing)}"
+    return cfn_template
+
+
+@pytest.fixture(scope="session")
+def resources(validated_template):
+    return validated_template['Resources']
+
+
+@pytest.fixture(scope="session")
+def outputs(validated_template):
+    return validated_template['Outputs']
+
+
+@pytest.fixture(scope="session")
+def distribution_config(resources):
+    return resources['CloudFrontDistribution']['Properties']['DistributionConfig']
+
+
+@pytest.fixture
+def cfn_mocks(monkeypatch):
+    """Patch boto3.client as seen by deploy_function and return the (CloudFormation, CloudFront) mocks."""
+    # Specced to the calls deploy_function makes so a mistyped attribute fails fast
+    mock_cfn = Mock(spec=['describe_stacks', 'create_stack', 'update_stack', 'create_change_set',
+                          'execute_change_set', 'get_waiter', 'get_template', 'exceptions'])
+    mock_cf = Mock(spec=['get_distribution', 'list_distributions'])
+
+    def client(service, region_name=None, **kwargs):
+        return mock_cfn if service == 'cloudformation' else mock_cf
+
+    monkeypatch.setattr('deploy_function.boto3.client', client)
+    return mock_cfn, mock_cf
@@ -470,14 +470,13 @@ class TestAWSResourceManager(unittest.TestCase):
 
     @patch('deploy_function.update_stack_parameters')
     @patch('deploy_function.deploy_cloudformation_template')
-    @patch('update_website.update_index_html')
-    @patch('update_website.add_messaging_to_solution_demos')
+    @patch('update_website.update_website_content')
     @patch('aws_resource_manager.upload_static_website')
     @patch('aws_resource_manager.load_config')
     @patch('aws_resource_manager.parse_arguments')
     def test_main_with_messaging_deploy_and_website_update(self, mock_parse_arguments, mock_load_config, 
-                                       mock_upload_static_website, mock_add_messaging, 
-                                       mock_update_index, mock_deploy_cloudformation, mock_update_stack_parameters):
+                                       mock_upload_static_website, mock_update_content,
+                                       mock_deploy_cloudformation, mock_update_stack_parameters):
         """Test main function with messaging solution deployment and static website stack update."""
         # Mock arguments
         mock_args = MagicMock()
@@ -518,9 +517,8 @@ class TestAWSResourceManager(unittest.TestCase):
             'message': 'Stack updated successfully with new parameters.'
         }
         
-        # Mock update_index_html and add_messaging_to_solution_demos to return True
-        mock_update_index.return_value = True
-        mock_add_messaging.return_value = True
+        # Mock update_website_content to return True
+        mock_update_content.return_value = True
         
         # Mock upload_static_website to return True
         mock_upload_static_website.return_value = True
@@ -556,14 +554,11 @@ class TestAWSResourceManager(unittest.TestCase):
             config_arg
         )
         
-        # Check that update_index_html was called with the correct arguments
-        mock_update_index.assert_called_once_with(
+        # Check that index.html was updated once with the correct arguments
+        mock_update_content.assert_called_once_with(
             'https://api.example.com/prod/contact', config_arg
         )
         
-        # Check that add_messaging_to_solution_demos was called
-        mock_add_messaging.assert_called_once_with(config_arg)
-        
         # Check that upload_static_website was called with the correct arguments
         mock_upload_static_website.assert_called_once_with(
             'test-bucket', 'us-west-2', config_arg
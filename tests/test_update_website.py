@@ -3,37 +3,37 @@
 Unit tests for the Update Website Script
 """
 
+import copy
 import unittest
 import sys
 import os
+import re
 import tempfile
-from unittest.mock import patch, MagicMock
+from argparse import Namespace
+from unittest.mock import patch, ANY, DEFAULT, MagicMock
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path to import the script
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(str(_REPO_ROOT))
 import update_website
 
+# Minimal configuration shared by the tests; deep-copied wherever a test mutates it
+_BASE_CONFIG = {
+    'region': 'us-west-2',
+    'solutions': {
+        'static_website': {
+            'content_dir': 'test_content'
+        }
+    }
+}
 
-class TestUpdateWebsite(unittest.TestCase):
-    """Test cases for Update Website Script."""
+# URLs passed to fetch() in index.html, collected in one scan
+_FETCH_RE = re.compile(rb"fetch\('([^']+)'")
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_config = {
-            'solutions': {
-                'static_website': {
-                    'content_dir': 'test_content'
-                }
-            }
-        }
-        
-        # Create a temporary directory for test content
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.content_path = Path(self.temp_dir.name)
-        
-        # Create a test index.html file
-        self.test_html = """<!DOCTYPE html>
+# Canonical index.html fixture, encoded once and written into each test's content directory
+_TEST_HTML_BYTES = b"""<!DOCTYPE html>
 <html>
 <head>
   <title>Test Page</title>
@@ -77,6 +77,16 @@ class TestUpdateWebsite(unittest.TestCase):
             <p>
               A responsive static website hosted on AWS S3 and delivered globally via CloudFront with WAF protection.
             </p>
+            <ul>
+              <li>
+                <p>
+                  Deployed using CloudFormation for infrastructure as code
+                </p>
+              </li>
+            </ul>
+            <p>
+              <span class="bolded">Technologies: </span>AWS S3, CloudFront, HTML/CSS/JavaScript
+            </p>
           </div>
         </div>
       </li>
@@ -84,15 +94,40 @@ class TestUpdateWebsite(unittest.TestCase):
   </div>
 </body>
 </html>"""
+
+
+class TestUpdateWebsite(unittest.TestCase):
+    """Test cases for Update Website Script."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root shared by every test in the class."""
+        # Tagged with the worker's pid so parallel (xdist) workers never share a root
+        cls._root_tmp = tempfile.TemporaryDirectory(prefix=f"rubble-{os.getpid()}-")
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary root and all per-test directories under it."""
+        cls._root_tmp.cleanup()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Start every test without CloudFormation clients or stack outputs cached by another
+        update_website._CFN_CLIENTS.clear()
+        update_website._STACK_OUTPUTS_CACHE.clear()
+        
+        self.test_config = copy.deepcopy(_BASE_CONFIG)
+        
+        # Give each test its own content directory under the shared root
+        self.content_path = Path(tempfile.mkdtemp(dir=self._root_tmp.name))
         
         # Write the test HTML to a file
         self.index_path = self.content_path / 'index.html'
-        with open(self.index_path, 'w') as f:
-            f.write(self.test_html)
-
-    def tearDown(self):
-        """Clean up after tests."""
-        self.temp_dir.cleanup()
+        fd = os.open(self.index_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, _TEST_HTML_BYTES)
+        finally:
+            os.close(fd)
 
     @patch('boto3.client')
     def test_get_api_endpoint(self, mock_boto_client):
@@ -115,10 +150,18 @@ class TestUpdateWebsite(unittest.TestCase):
         self.assertEqual(api_endpoint, 'https://api.example.com/prod/contact')
         
         # Verify CloudFormation client was called correctly
-        mock_boto_client.assert_called_with('cloudformation', region_name='us-west-2')
+        mock_boto_client.assert_called_with('cloudformation', region_name='us-west-2', config=ANY)
+        retry_config = mock_boto_client.call_args.kwargs['config'].retries
+        self.assertEqual(retry_config, {'max_attempts': 10, 'mode': 'adaptive'})
         mock_cfn.describe_stacks.assert_called_with(StackName='test-stack')
         
+        # A second lookup for the same stack is served from the cache
+        self.assertEqual(update_website.get_api_endpoint('test-stack', 'us-west-2'), api_endpoint)
+        mock_boto_client.assert_called_once()
+        mock_cfn.describe_stacks.assert_called_once()
+        
         # Test with missing ApiEndpoint
+        update_website._STACK_OUTPUTS_CACHE.clear()
         mock_cfn.describe_stacks.return_value = {
             'Stacks': [{
                 'Outputs': [
@@ -131,6 +174,7 @@ class TestUpdateWebsite(unittest.TestCase):
         self.assertIsNone(api_endpoint)
         
         # Test with exception
+        update_website._STACK_OUTPUTS_CACHE.clear()
         mock_cfn.describe_stacks.side_effect = Exception('Test exception')
         api_endpoint = update_website.get_api_endpoint('test-stack', 'us-west-2')
         self.assertIsNone(api_endpoint)
@@ -147,49 +191,34 @@ class TestUpdateWebsite(unittest.TestCase):
         # Check that the function returned True (success)
         self.assertTrue(result)
         
-        # Read the updated file
-        with open(self.index_path, 'r') as f:
-            updated_content = f.read()
-        
         # Check that the API endpoint was updated
-        self.assertIn(f"fetch('{api_endpoint}'", updated_content)
-        self.assertNotIn("fetch('${ApiEndpoint}'", updated_content)
+        fetch_urls = _FETCH_RE.findall(self.index_path.read_bytes())
+        self.assertIn(api_endpoint.encode(), fetch_urls)
+        self.assertNotIn(b'${ApiEndpoint}', fetch_urls)
+        
+        # Endpoints are inserted literally, even if they look like regex backreferences
+        literal_endpoint = r'https://api.example.com/prod/\1\g<0>'
+        self.assertTrue(update_website.update_index_html(literal_endpoint, self.test_config))
+        self.assertIn(literal_endpoint.encode(), _FETCH_RE.findall(self.index_path.read_bytes()))
         
         # Test with non-existent content directory
         self.test_config['solutions']['static_website']['content_dir'] = 'non_existent_dir'
         
-        # Create a backup of the original index.html
-        with open(self.index_path, 'r') as f:
-            original_content = f.read()
+        # Create a fallback index.html in a search directory outside the repository
+        fallback_dir = Path(tempfile.mkdtemp(dir=self._root_tmp.name))
+        fallback_index_path = fallback_dir / 'index.html'
+        fallback_index_path.write_bytes(_TEST_HTML_BYTES)
         
-        # Create a new index.html in the parent directory
-        parent_index_path = Path('iac/static_website/index.html')
-        os.makedirs(os.path.dirname(parent_index_path), exist_ok=True)
-        with open(parent_index_path, 'w') as f:
-            f.write(self.test_html)
+        # Test the function with the fallback directory
+        result = update_website.update_index_html(api_endpoint, self.test_config, search_dirs=[str(fallback_dir)])
         
-        try:
-            # Test the function with the parent directory
-            result = update_website.update_index_html(api_endpoint, self.test_config)
-            
-            # Check that the function returned True (success)
-            self.assertTrue(result)
-            
-            # Read the updated file
-            with open(parent_index_path, 'r') as f:
-                updated_content = f.read()
-            
-            # Check that the API endpoint was updated
-            self.assertIn(f"fetch('{api_endpoint}'", updated_content)
-            self.assertNotIn("fetch('${ApiEndpoint}'", updated_content)
-        finally:
-            # Clean up the parent index.html
-            if parent_index_path.exists():
-                os.remove(parent_index_path)
-            
-            # Restore the original index.html
-            with open(self.index_path, 'w') as f:
-                f.write(original_content)
+        # Check that the function returned True (success)
+        self.assertTrue(result)
+        
+        # Check that the API endpoint was updated
+        fetch_urls = _FETCH_RE.findall(fallback_index_path.read_bytes())
+        self.assertIn(api_endpoint.encode(), fetch_urls)
+        self.assertNotIn(b'${ApiEndpoint}', fetch_urls)
 
     def test_add_messaging_to_solution_demos(self):
         """Test adding messaging solution to Solution Demonstrations section."""
@@ -210,51 +239,125 @@ class TestUpdateWebsite(unittest.TestCase):
         self.assertIn("AWS End User Messaging", updated_content)
         self.assertIn("SMS and Email Contact Forms", updated_content)
         
+        # The new entry follows the static website entry's closing </li> rather than
+        # landing inside its nested list, and the section's list is still closed after it
+        static_website_end = updated_content.index("\n      </li>")
+        messaging_start = updated_content.index("AWS End User Messaging")
+        self.assertLess(static_website_end, messaging_start)
+        self.assertRegex(updated_content[messaging_start:], r"</li>\s*</ul>\s*</div>\s*</body>")
+        
         # Test adding it again (should not duplicate)
+        content_after_first = self.index_path.read_bytes()
         result = update_website.add_messaging_to_solution_demos(self.test_config)
         self.assertTrue(result)
         
-        # Read the updated file
-        with open(self.index_path, 'r') as f:
-            updated_content = f.read()
+        # The second call must leave the file untouched
+        self.assertEqual(self.index_path.read_bytes(), content_after_first,
+                         "Messaging solution should only appear once")
+
+    def test_update_website_content(self):
+        """Test applying the API endpoint and messaging solution in a single write."""
+        # Override the content_dir in the test config
+        self.test_config['solutions']['static_website']['content_dir'] = str(self.content_path)
+        
+        # Test the function
+        api_endpoint = 'https://api.example.com/prod/contact'
+        with patch('update_website._write_index_html', wraps=update_website._write_index_html) as mock_write:
+            result = update_website.update_website_content(api_endpoint, self.test_config)
+        
+        # Check that the function returned True (success) and wrote the file once
+        self.assertTrue(result)
+        mock_write.assert_called_once()
+        
+        # Check that both updates were applied
+        updated_content = self.index_path.read_bytes()
+        self.assertIn(api_endpoint.encode(), _FETCH_RE.findall(updated_content))
+        self.assertIn(b"SMS and Email Contact Forms", updated_content)
+        
+        # Re-running with the same endpoint leaves the file as it is
+        with patch('update_website._write_index_html') as mock_write:
+            result = update_website.update_website_content(api_endpoint, self.test_config)
+        self.assertTrue(result)
+        mock_write.assert_not_called()
+
+    def test_update_website_content_copies_unchanged_fallback(self):
+        """Test that an already-updated fallback index.html is still copied into an empty content directory."""
+        api_endpoint = 'https://api.example.com/prod/contact'
+        
+        # A fallback index.html that already has both updates applied
+        fallback_dir = Path(tempfile.mkdtemp(dir=self._root_tmp.name))
+        fallback_index_path = fallback_dir / 'index.html'
+        fallback_index_path.write_bytes(update_website._apply_all_updates(_TEST_HTML_BYTES, api_endpoint))
+        fallback_mtime = fallback_index_path.stat().st_mtime_ns
+        
+        # An existing content directory without index.html
+        empty_content_path = Path(tempfile.mkdtemp(dir=self._root_tmp.name))
+        self.test_config['solutions']['static_website']['content_dir'] = str(empty_content_path)
+        
+        result = update_website.update_website_content(api_endpoint, self.test_config, search_dirs=[str(fallback_dir)])
+        
+        # The fallback is left as it is and copied into the content directory
+        self.assertTrue(result)
+        self.assertEqual(fallback_index_path.stat().st_mtime_ns, fallback_mtime)
+        self.assertEqual((empty_content_path / 'index.html').read_bytes(), fallback_index_path.read_bytes())
+
+    def test_update_website_content_with_null_static_website(self):
+        """Test that a static_website section with no value is reported instead of raising."""
+        self.test_config['solutions']['static_website'] = None
+        
+        with patch('update_website._write_index_html') as mock_write:
+            result = update_website.update_website_content('https://api.example.com/prod/contact', self.test_config)
+        
+        self.assertFalse(result)
+        mock_write.assert_not_called()
+
+
+class TestUpdateWebsiteMain(unittest.TestCase):
+    """Test cases for the Update Website Script's main function."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch main's collaborators once for every test in the class."""
+        patcher = patch.multiple(
+            'update_website',
+            parse_arguments=DEFAULT,
+            load_config=DEFAULT,
+            get_api_endpoint=DEFAULT,
+            update_website_content=DEFAULT
+        )
+        mocks = patcher.start()
+        cls.addClassCleanup(patcher.stop)
         
-        # Count occurrences of the messaging solution
-        count = updated_content.count("AWS End User Messaging")
-        self.assertEqual(count, 1, "Messaging solution should only appear once")
-        
-    @patch('update_website.parse_arguments')
-    @patch('update_website.load_config')
-    @patch('update_website.get_api_endpoint')
-    @patch('update_website.update_index_html')
-    @patch('update_website.add_messaging_to_solution_demos')
-    def test_main_with_static_website_stack(self, mock_add_messaging, mock_update_index, 
-                                           mock_get_api_endpoint, mock_load_config, mock_parse_arguments):
+        cls.mock_parse_arguments = mocks['parse_arguments']
+        cls.mock_load_config = mocks['load_config']
+        cls.mock_get_api_endpoint = mocks['get_api_endpoint']
+        cls.mock_update_content = mocks['update_website_content']
+
+    def setUp(self):
+        """Clear calls and configuration left on the shared mocks by earlier tests."""
+        for mock in (self.mock_parse_arguments, self.mock_load_config, self.mock_get_api_endpoint,
+                     self.mock_update_content):
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    def test_main_with_static_website_stack(self):
         """Test main function with static_website_stack parameter."""
         # Mock arguments
-        mock_args = MagicMock()
-        mock_args.config = 'config.yaml'
-        mock_args.stack_name = 'test-messaging-stack'
-        mock_args.static_website_stack = 'test-static-website-stack'
-        mock_args.region = 'us-west-2'
-        mock_parse_arguments.return_value = mock_args
+        self.mock_parse_arguments.return_value = Namespace(
+            config='config.yaml',
+            stack_name='test-messaging-stack',
+            static_website_stack='test-static-website-stack',
+            region='us-west-2'
+        )
         
         # Mock config
-        mock_config = {
-            'region': 'us-west-2',
-            'solutions': {
-                'static_website': {
-                    'content_dir': 'test_content'
-                }
-            }
-        }
-        mock_load_config.return_value = mock_config
+        mock_config = copy.deepcopy(_BASE_CONFIG)
+        self.mock_load_config.return_value = mock_config
         
         # Mock API endpoint
-        mock_get_api_endpoint.return_value = 'https://api.example.com/prod/contact'
+        self.mock_get_api_endpoint.return_value = 'https://api.example.com/prod/contact'
         
-        # Mock update functions to return True
-        mock_update_index.return_value = True
-        mock_add_messaging.return_value = True
+        # Mock the content update to return True
+        self.mock_update_content.return_value = True
         
         # Test the function
         with patch('sys.exit') as mock_exit:
@@ -264,7 +367,7 @@ class TestUpdateWebsite(unittest.TestCase):
             mock_exit.assert_not_called()
         
         # Check that get_api_endpoint was called with the correct arguments
-        mock_get_api_endpoint.assert_called_once_with('test-messaging-stack', 'us-west-2')
+        self.mock_get_api_endpoint.assert_called_once_with('test-messaging-stack', 'us-west-2')
         
         # Check that the static_website_stack parameter was added to the config
         self.assertEqual(
@@ -272,12 +375,61 @@ class TestUpdateWebsite(unittest.TestCase):
             'test-static-website-stack'
         )
         
-        # Check that update_index_html was called with the correct arguments
-        mock_update_index.assert_called_once_with('https://api.example.com/prod/contact', mock_config)
+        # Check that index.html was updated once with the correct arguments
+        self.mock_update_content.assert_called_once_with('https://api.example.com/prod/contact', mock_config)
+
+    def test_main_with_empty_static_website_config(self):
+        """Test that an empty static_website section is accepted, leaving content_dir at its default."""
+        self.mock_parse_arguments.return_value = Namespace(
+            config='config.yaml',
+            stack_name='test-messaging-stack',
+            static_website_stack='test-static-website-stack',
+            region='us-west-2'
+        )
+        mock_config = {'region': 'us-west-2', 'solutions': {'static_website': {}}}
+        self.mock_load_config.return_value = mock_config
+        self.mock_get_api_endpoint.return_value = 'https://api.example.com/prod/contact'
+        self.mock_update_content.return_value = True
+        
+        with patch('sys.exit') as mock_exit:
+            update_website.main()
+            mock_exit.assert_not_called()
+        
+        self.mock_update_content.assert_called_once_with('https://api.example.com/prod/contact', mock_config)
+
+    def test_main_with_null_static_website_config(self):
+        """Test that main exits before querying the stack when static_website has no value."""
+        self.mock_parse_arguments.return_value = Namespace(
+            config='config.yaml',
+            stack_name='test-messaging-stack',
+            static_website_stack='test-static-website-stack',
+            region='us-west-2'
+        )
+        self.mock_load_config.return_value = {'region': 'us-west-2', 'solutions': {'static_website': None}}
+        
+        with self.assertRaises(SystemExit) as cm:
+            update_website.main()
+        
+        self.assertEqual(cm.exception.code, 1)
+        self.mock_get_api_endpoint.assert_not_called()
+        self.mock_update_content.assert_not_called()
+
+    def test_main_without_static_website_config(self):
+        """Test that main exits before querying the stack when static_website is not configured."""
+        self.mock_parse_arguments.return_value = Namespace(
+            config='config.yaml',
+            stack_name='test-messaging-stack',
+            static_website_stack='test-static-website-stack',
+            region='us-west-2'
+        )
+        self.mock_load_config.return_value = {'region': 'us-west-2', 'solutions': {}}
+        
+        with self.assertRaises(SystemExit) as cm:
+            update_website.main()
         
-        # Check that add_messaging_to_solution_demos was called with the correct arguments
-        mock_add_messaging.assert_called_once_with(mock_config)
-        self.assertEqual(count, 1, "Messaging solution should only appear once")
+        self.assertEqual(cm.exception.code, 1)
+        self.mock_get_api_endpoint.assert_not_called()
+        self.mock_update_content.assert_not_called()
 
 
 if __name__ == '__main__':
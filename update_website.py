@@ -7,175 +7,27 @@ from a deployed messaging solution. It should be run after deploying the messagi
 """
 
 import argparse
-import boto3
 import os
 import re
+import stat
 import sys
-import yaml
 from pathlib import Path
 
+# CloudFormation clients by region and stack outputs by (region, stack name), reused within a run
+_CFN_CLIENTS = {}
+_STACK_OUTPUTS_CACHE = {}
 
-def parse_arguments():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description='Update Website Script')
-    parser.add_argument('--config', type=str, default='config.yaml',
-                        help='Path to configuration file')
-    parser.add_argument('--stack_name', type=str, required=True,
-                        help='CloudFormation stack name for the messaging solution')
-    parser.add_argument('--static_website_stack', type=str, required=True,
-                        help='Name of the static website stack to update')
-    parser.add_argument('--region', type=str,
-                        help='AWS region (overrides config file)')
-    return parser.parse_args()
-
-
-def load_config(config_path):
-    """Load configuration from YAML file."""
-    try:
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
-    except FileNotFoundError:
-        print(f"Error: Configuration file '{config_path}' not found.")
-        sys.exit(1)
-    except yaml.YAMLError as e:
-        print(f"Error parsing configuration file: {e}")
-        sys.exit(1)
-
-
-def get_api_endpoint(stack_name, region):
-    """Get the API endpoint from the CloudFormation stack outputs."""
-    try:
-        # Initialize CloudFormation client
-        cfn = boto3.client('cloudformation', region_name=region)
-        
-        # Get stack outputs
-        response = cfn.describe_stacks(StackName=stack_name)
-        
-        # Find the ApiEndpoint output
-        for output in response['Stacks'][0]['Outputs']:
-            if output['OutputKey'] == 'ApiEndpoint':
-                return output['OutputValue']
-        
-        print(f"Error: ApiEndpoint not found in stack outputs for {stack_name}")
-        return None
-    except Exception as e:
-        print(f"Error getting API endpoint from stack: {e}")
-        return None
-
-
-def update_index_html(api_endpoint, config):
-    """Update the index.html file with the API endpoint."""
-    try:
-        # Get the static website content directory
-        if 'solutions' not in config or 'static_website' not in config['solutions']:
-            print("Error: Static website solution not found in configuration.")
-            return False
-        
-        solution_config = config['solutions']['static_website']
-        
-        # Check if the content directory exists
-        content_dir = solution_config.get('content_dir', 'iac/static_website/content')
-        content_path = Path(content_dir)
-        
-        if not content_path.exists() or not content_path.is_dir():
-            # Try the main directory
-            content_path = Path('iac/static_website')
-            if not content_path.exists() or not content_path.is_dir():
-                print(f"Error: Static website directory not found.")
-                return False
-        
-        # Find the index.html file
-        index_path = content_path / 'index.html'
-        if not index_path.exists():
-            # Try the parent directory
-            index_path = Path('iac/static_website/index.html')
-            if not index_path.exists():
-                print(f"Error: index.html file not found.")
-                return False
-        
-        # Read the index.html file
-        with open(index_path, 'r') as file:
-            content = file.read()
-        
-        # Update the API endpoint in the file
-        # Look for the fetch URL pattern in the JavaScript code
-        pattern = r"fetch\('([^']*)',"
-        if re.search(pattern, content):
-            updated_content = re.sub(pattern, f"fetch('{api_endpoint}',", content)
-            
-            # Write the updated content back to the file
-            with open(index_path, 'w') as file:
-                file.write(updated_content)
-            
-            print(f"Successfully updated index.html with API endpoint: {api_endpoint}")
-            
-            # Also update the content directory if it's different
-            if index_path != content_path / 'index.html':
-                # Ensure the content directory exists
-                os.makedirs(content_path, exist_ok=True)
-                
-                # Copy the updated file to the content directory
-                with open(content_path / 'index.html', 'w') as file:
-                    file.write(updated_content)
-                
-                print(f"Also copied updated index.html to content directory: {content_path}")
-            
-            return True
-        else:
-            print("Error: Could not find API endpoint placeholder in index.html")
-            return False
-    
-    except Exception as e:
-        print(f"Error updating index.html: {e}")
-        return False
+# The contact form's fetch() call, whose URL is replaced with the API endpoint
+_FETCH_URL_RE = re.compile(rb"fetch\('([^']*)',")
 
+# The Solution Demonstrations list; group 1 is the existing <li> entries. Entries contain nested
+# lists, so the match ends at the </ul> that closes the section's <div>, not at the first </ul>
+_SOLUTION_DEMOS_RE = re.compile(
+    rb'<div class="solutionDemos">\s*<h2>\s*Solution Demonstrations\s*</h2>\s*<ul>(.*?)</ul>\s*</div>', re.DOTALL
+)
 
-def add_messaging_to_solution_demos(config):
-    """Add the messaging solution to the Solution Demonstrations section in index.html."""
-    try:
-        # Get the static website content directory
-        if 'solutions' not in config or 'static_website' not in config['solutions']:
-            print("Error: Static website solution not found in configuration.")
-            return False
-        
-        solution_config = config['solutions']['static_website']
-        
-        # Check if the content directory exists
-        content_dir = solution_config.get('content_dir', 'iac/static_website/content')
-        content_path = Path(content_dir)
-        
-        if not content_path.exists() or not content_path.is_dir():
-            # Try the main directory
-            content_path = Path('iac/static_website')
-            if not content_path.exists() or not content_path.is_dir():
-                print(f"Error: Static website directory not found.")
-                return False
-        
-        # Find the index.html file
-        index_path = content_path / 'index.html'
-        if not index_path.exists():
-            # Try the parent directory
-            index_path = Path('iac/static_website/index.html')
-            if not index_path.exists():
-                print(f"Error: index.html file not found.")
-                return False
-        
-        # Read the index.html file
-        with open(index_path, 'r') as file:
-            content = file.read()
-        
-        # Check if the messaging solution is already in the Solution Demonstrations section
-        if 'AWS End User Messaging' in content:
-            print("Messaging solution already in Solution Demonstrations section.")
-            return True
-        
-        # Find the Solution Demonstrations section
-        solution_demos_pattern = r'<div class="solutionDemos">\s*<h2>\s*Solution Demonstrations\s*</h2>\s*<ul>(.*?)</ul>'
-        solution_demos_match = re.search(solution_demos_pattern, content, re.DOTALL)
-        
-        if solution_demos_match:
-            # Create the new solution demo entry
-            messaging_solution_entry = """
+# Solution Demonstrations entry for the messaging solution, indented to match the static website entry
+_MESSAGING_SOLUTION_ENTRY = b"""
             <li>
               <div class="jobPosition">
                 <span class="bolded">
@@ -218,48 +70,307 @@ def add_messaging_to_solution_demos(config):
                 </div>
               </div>
             </li>"""
-            
-            # Insert the new solution demo entry after the existing entries
-            # Make sure it's properly nested at the same level as the static website entry
-            updated_content = re.sub(
-                solution_demos_pattern,
-                f'<div class="solutionDemos">\n          <h2>\n            Solution Demonstrations\n          </h2>\n          <ul>{solution_demos_match.group(1)}{messaging_solution_entry}\n          </ul>',
-                content,
-                flags=re.DOTALL
-            )
-            
-            # Write the updated content back to the file
-            with open(index_path, 'w') as file:
-                file.write(updated_content)
-            
-            print("Successfully added messaging solution to Solution Demonstrations section.")
-            
-            # Also update the content directory if it's different
-            if index_path != content_path / 'index.html':
-                # Ensure the content directory exists
-                os.makedirs(content_path, exist_ok=True)
-                
-                # Copy the updated file to the content directory
-                with open(content_path / 'index.html', 'w') as file:
-                    file.write(updated_content)
-                
-                print(f"Also copied updated index.html to content directory: {content_path}")
-            
-            return True
-        else:
-            print("Error: Could not find Solution Demonstrations section in index.html")
-            return False
+
+# Directories searched, in order, for index.html when the configured content_dir has none
+DEFAULT_SEARCH_DIRS = ('iac/static_website',)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Update Website Script')
+    parser.add_argument('--config', type=str, default='config.yaml',
+                        help='Path to configuration file')
+    parser.add_argument('--stack_name', type=str, required=True,
+                        help='CloudFormation stack name for the messaging solution')
+    parser.add_argument('--static_website_stack', type=str, required=True,
+                        help='Name of the static website stack to update')
+    parser.add_argument('--region', type=str,
+                        help='AWS region (overrides config file)')
+    return parser.parse_args()
+
+
+def load_config(config_path):
+    """Load configuration from YAML file."""
+    # Imported here so --help and argument errors don't pay PyYAML's import cost
+    import yaml
     
+    # Prefer the LibYAML-backed loader; the pure-Python SafeLoader is much slower
+    try:
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader
+    
+    try:
+        # Binary mode lets LibYAML decode the bytes itself
+        with open(config_path, 'rb') as file:
+            return yaml.load(file, Loader=_SafeLoader)
+    except FileNotFoundError:
+        print(f"Error: Configuration file '{config_path}' not found.")
+        sys.exit(1)
+    except yaml.YAMLError as e:
+        print(f"Error parsing configuration file: {e}")
+        sys.exit(1)
+
+
+def _ensure_config_shape(config):
+    """Check the configuration has a static website solution and return the messaging parameters dict.
+
+    Missing solutions.messaging.parameters levels are created; raises ValueError if
+    solutions.static_website is missing or is not a mapping (an empty one is fine).
+    """
+    solutions = config.setdefault('solutions', {})
+    if 'static_website' not in solutions:
+        raise ValueError("Static website solution not found in configuration.")
+    if not isinstance(solutions['static_website'], dict):
+        raise ValueError("solutions.static_website in configuration must be a mapping, e.g. {}.")
+    return solutions.setdefault('messaging', {}).setdefault('parameters', {})
+
+
+def _get_cfn(region):
+    """Return the CloudFormation client for a region, creating it on first use."""
+    if region not in _CFN_CLIENTS:
+        # Imported here so the file-editing paths don't pay boto3's import cost
+        import boto3
+        from botocore.config import Config
+        
+        # Back off and retry on throttling, e.g. when several pipelines query stacks at once
+        _CFN_CLIENTS[region] = boto3.client(
+            'cloudformation', region_name=region,
+            config=Config(retries={'max_attempts': 10, 'mode': 'adaptive'})
+        )
+    return _CFN_CLIENTS[region]
+
+
+def _stack_outputs(region, stack_name):
+    """Return a stack's outputs as {OutputKey: OutputValue}, calling DescribeStacks at most once per (region, stack)."""
+    key = (region, stack_name)
+    if key not in _STACK_OUTPUTS_CACHE:
+        response = _get_cfn(region).describe_stacks(StackName=stack_name)
+        # Keep only the outputs; the rest of the stack description is never used
+        _STACK_OUTPUTS_CACHE[key] = {
+            output['OutputKey']: output['OutputValue'] for output in response['Stacks'][0].get('Outputs', [])
+        }
+    return _STACK_OUTPUTS_CACHE[key]
+
+
+def get_api_endpoint(stack_name, region):
+    """Get the API endpoint from the CloudFormation stack outputs."""
+    try:
+        # Find the ApiEndpoint output
+        api_endpoint = _stack_outputs(region, stack_name).get('ApiEndpoint')
+        if api_endpoint is None:
+            print(f"Error: ApiEndpoint not found in stack outputs for {stack_name}")
+        return api_endpoint
     except Exception as e:
-        print(f"Error adding messaging solution to Solution Demonstrations: {e}")
+        print(f"Error getting API endpoint from stack: {e}")
+        return None
+
+
+def _stat_or_none(path):
+    """Return os.stat(path), or None if it does not exist or cannot be read."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _is_dir(path):
+    """Return True if path is an existing directory, using a single stat call."""
+    st = _stat_or_none(path)
+    return st is not None and stat.S_ISDIR(st.st_mode)
+
+
+def _resolve_index_path(config, search_dirs=DEFAULT_SEARCH_DIRS):
+    """Locate the static website's content directory and index.html.
+
+    Falls back to the first of search_dirs holding the file when content_dir does not.
+    Returns a (content_path, index_path) tuple, or None after printing an error.
+    """
+    # Get the static website content directory
+    if 'solutions' not in config or 'static_website' not in config['solutions']:
+        print("Error: Static website solution not found in configuration.")
+        return None
+    
+    solution_config = config['solutions']['static_website']
+    if not isinstance(solution_config, dict):
+        print("Error: solutions.static_website in configuration must be a mapping.")
+        return None
+    
+    # Check if the content directory exists
+    content_dir = solution_config.get('content_dir', 'iac/static_website/content')
+    content_path = Path(content_dir)
+    
+    if not _is_dir(content_path):
+        # Try the search directories
+        content_path = next((Path(d) for d in search_dirs if _is_dir(d)), None)
+        if content_path is None:
+            print(f"Error: Static website directory not found.")
+            return None
+    
+    # Find the index.html file
+    index_path = content_path / 'index.html'
+    if _stat_or_none(index_path) is None:
+        # Try the search directories
+        index_path = next((Path(d) / 'index.html' for d in search_dirs if _stat_or_none(Path(d) / 'index.html') is not None), None)
+        if index_path is None:
+            print(f"Error: index.html file not found.")
+            return None
+    
+    return content_path, index_path
+
+
+def _load_index(index_path):
+    """Read index.html into memory as bytes; the edits only touch ASCII markup, so it is never decoded."""
+    return index_path.read_bytes()
+
+
+def _copy_to_content_dir(content_path, index_path, content):
+    """Copy index.html into the content directory when it was found elsewhere and the copy there is missing or stale."""
+    content_index_path = content_path / 'index.html'
+    
+    # Compare canonical paths so e.g. a relative and an absolute spelling of the same
+    # directory are not treated as two files
+    if index_path.resolve() == content_index_path.resolve():
+        return
+    
+    # Leave an up-to-date copy alone, checking its size before reading it
+    st = _stat_or_none(content_index_path)
+    if st is not None and st.st_size == len(content) and content_index_path.read_bytes() == content:
+        return
+    
+    # Ensure the content directory exists
+    content_path.mkdir(parents=True, exist_ok=True)
+    
+    # Copy the updated file to the content directory
+    content_index_path.write_bytes(content)
+    
+    print(f"Also copied updated index.html to content directory: {content_path}")
+
+
+def _write_index_html(content_path, index_path, content):
+    """Write index.html, also copying it into the content directory when it was found elsewhere."""
+    index_path.write_bytes(content)
+    _copy_to_content_dir(content_path, index_path, content)
+
+
+def _set_api_endpoint(content, api_endpoint):
+    """Return content with the contact form's fetch() URL set to api_endpoint, or None if it has none."""
+    # Look for the fetch URL pattern in the JavaScript code
+    fetch_match = _FETCH_URL_RE.search(content)
+    if not fetch_match:
+        print("Error: Could not find API endpoint placeholder in index.html")
+        return None
+    
+    # Splice the endpoint in place of the URL; unlike a re.sub template it is inserted literally
+    return content[:fetch_match.start(1)] + api_endpoint.encode('utf-8') + content[fetch_match.end(1):]
+
+
+def _add_messaging_entry(content):
+    """Return content with the messaging solution listed under Solution Demonstrations.
+
+    Content that already lists it is returned unchanged; None means the section was not found.
+    """
+    # Find the Solution Demonstrations section
+    solution_demos_match = _SOLUTION_DEMOS_RE.search(content)
+    
+    if not solution_demos_match:
+        print("Error: Could not find Solution Demonstrations section in index.html")
+        return None
+    
+    # Check if the messaging solution is already in the section, looking only at its list entries
+    if b'AWS End User Messaging' in solution_demos_match.group(1):
+        print("Messaging solution already in Solution Demonstrations section.")
+        return content
+    
+    # Insert the new solution demo entry right after the last existing entry, keeping the
+    # whitespace before </ul> so it stays nested at the same level as the static website entry
+    insert_at = solution_demos_match.start(1) + len(solution_demos_match.group(1).rstrip())
+    return content[:insert_at] + _MESSAGING_SOLUTION_ENTRY + content[insert_at:]
+
+
+def _apply_all_updates(content, api_endpoint):
+    """Apply every index.html change in memory; returns None if any of them fails."""
+    content = _set_api_endpoint(content, api_endpoint)
+    if content is None:
+        return None
+    return _add_messaging_entry(content)
+
+
+def _update_index(config, search_dirs, transform, success_message, error_message):
+    """Read index.html, apply transform to its content and write the result back if it changed.
+
+    transform returns the updated content, or None after printing an error.
+    Returns True on success, False otherwise.
+    """
+    try:
+        paths = _resolve_index_path(config, search_dirs)
+        if paths is None:
+            return False
+        content_path, index_path = paths
+        
+        content = _load_index(index_path)
+        
+        updated_content = transform(content)
+        if updated_content is None:
+            return False
+        
+        if updated_content == content:
+            print("index.html unchanged, skipping write")
+            # The content directory may still lack a copy of a fallback index.html
+            _copy_to_content_dir(content_path, index_path, updated_content)
+        else:
+            _write_index_html(content_path, index_path, updated_content)
+            print(success_message)
+        return True
+    
+    except OSError as e:
+        print(f"{error_message}: {e}")
         return False
 
 
+def update_index_html(api_endpoint, config, search_dirs=DEFAULT_SEARCH_DIRS):
+    """Update the index.html file with the API endpoint.
+
+    Falls back to the first of search_dirs holding the file when content_dir does not.
+    """
+    return _update_index(
+        config, search_dirs,
+        lambda content: _set_api_endpoint(content, api_endpoint),
+        f"Successfully updated index.html with API endpoint: {api_endpoint}",
+        "Error updating index.html"
+    )
+
+
+def add_messaging_to_solution_demos(config, search_dirs=DEFAULT_SEARCH_DIRS):
+    """Add the messaging solution to the Solution Demonstrations section in index.html."""
+    return _update_index(
+        config, search_dirs,
+        _add_messaging_entry,
+        "Successfully added messaging solution to Solution Demonstrations section.",
+        "Error adding messaging solution to Solution Demonstrations"
+    )
+
+
+def update_website_content(api_endpoint, config, search_dirs=DEFAULT_SEARCH_DIRS):
+    """Apply every index.html update, reading and writing the file only once."""
+    return _update_index(
+        config, search_dirs,
+        lambda content: _apply_all_updates(content, api_endpoint),
+        f"Successfully updated index.html with API endpoint and messaging solution: {api_endpoint}",
+        "Error updating index.html"
+    )
+
+
 def main():
     """Main function to update the website."""
     # Parse arguments and load configuration
     args = parse_arguments()
     config = load_config(args.config)
+    try:
+        messaging_parameters = _ensure_config_shape(config)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     
     # Determine which region to use (CLI overrides config)
     region = args.region if args.region else config.get('region', 'us-east-1')
@@ -271,24 +382,13 @@ def main():
         sys.exit(1)
     
     # Store the static website stack name in the config
-    if 'solutions' not in config:
-        config['solutions'] = {}
-    if 'messaging' not in config['solutions']:
-        config['solutions']['messaging'] = {}
-    if 'parameters' not in config['solutions']['messaging']:
-        config['solutions']['messaging']['parameters'] = {}
-    config['solutions']['messaging']['parameters']['StaticWebsiteStackName'] = args.static_website_stack
+    messaging_parameters['StaticWebsiteStackName'] = args.static_website_stack
     
-    # Update the index.html file with the API endpoint
-    if not update_index_html(api_endpoint, config):
+    # Update the API endpoint and add the messaging solution to the Solution Demonstrations section
+    if not update_website_content(api_endpoint, config):
         print("Failed to update index.html. Exiting.")
         sys.exit(1)
     
-    # Add the messaging solution to the Solution Demonstrations section
-    if not add_messaging_to_solution_demos(config):
-        print("Failed to add messaging solution to Solution Demonstrations. Exiting.")
-        sys.exit(1)
-    
     print("Website update completed successfully!")
 
 